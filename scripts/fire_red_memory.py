@@ -37,6 +37,8 @@ Pokemon data structure (100 bytes per party member):
 from __future__ import annotations
 
 import struct
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from mgba_client import MGBAClient
@@ -47,10 +49,11 @@ from mgba_client import MGBAClient
 # ==========================================================================
 # Pokemon Gen 3 games use a proprietary character set (NOT ASCII/Unicode).
 # Byte 0xFF is the string terminator. Byte 0x00 is a space.
-# This table covers A-Z, a-z, 0-9, and common punctuation/symbols.
+# This table covers A-Z, a-z, 0-9, and common punctuation/symbols. It is
+# read-only: the decode tables below are built from it once at import.
 # ==========================================================================
 
-GEN3_CHARSET = {
+GEN3_CHARSET = MappingProxyType({
     # Uppercase A-Z (0xBB-0xD4)
     0xBB: "A", 0xBC: "B", 0xBD: "C", 0xBE: "D", 0xBF: "E",
     0xC0: "F", 0xC1: "G", 0xC2: "H", 0xC3: "I", 0xC4: "J",
@@ -76,7 +79,25 @@ GEN3_CHARSET = {
     0xB8: ",", 0xBA: "/",
     0x00: " ",       # space
     0xFF: "",        # string terminator (produces no character)
-}
+})
+
+# Lookup tables used by decode_gen3_string(), built once at import time.
+# _GEN3_TABLE is a 256-byte bytes.translate() table mapping every Gen 3 byte
+# to its ASCII character ('?' for unknown bytes). Entries that decode to a
+# multi-character or non-ASCII string (ellipsis, smart quotes, gender
+# symbols) map to their own byte value instead — all >= 0x80, so they can't
+# collide with real ASCII output — and _GEN3_SPECIAL expands those
+# placeholders with str.translate() afterwards.
+_GEN3_TABLE = bytearray(b"?" * 256)
+_GEN3_SPECIAL = {}
+for _byte, _char in GEN3_CHARSET.items():
+    if len(_char) == 1 and _char.isascii():
+        _GEN3_TABLE[_byte] = ord(_char)
+    elif _char:
+        _GEN3_TABLE[_byte] = _byte
+        _GEN3_SPECIAL[_byte] = _char
+_GEN3_TABLE = bytes(_GEN3_TABLE)
+del _byte, _char
 
 
 # ==========================================================================
@@ -84,8 +105,9 @@ GEN3_CHARSET = {
 # ==========================================================================
 # Maps species ID → display name. Gen 1 (1-151) is complete here.
 # For species > 151, the MCP layer will fall back to "Pokemon #N".
+# Read-only, since _SPECIES_NAME_LIST is derived from it at import.
 
-SPECIES_NAMES = {
+SPECIES_NAMES = MappingProxyType({
     0: "???",
     1: "Bulbasaur", 2: "Ivysaur", 3: "Venusaur",
     4: "Charmander", 5: "Charmeleon", 6: "Charizard",
@@ -161,7 +183,21 @@ SPECIES_NAMES = {
     144: "Articuno", 145: "Zapdos", 146: "Moltres",
     147: "Dratini", 148: "Dragonair", 149: "Dragonite",
     150: "Mewtwo", 151: "Mew",
-}
+})
+
+# Dense list view of SPECIES_NAMES for the parsing hot path: indexing a list
+# skips hashing, and IDs without a name are pre-filled with their fallback.
+_SPECIES_NAME_LIST = [f"Pokemon #{i}" for i in range(max(SPECIES_NAMES) + 1)]
+for _species, _name in SPECIES_NAMES.items():
+    _SPECIES_NAME_LIST[_species] = _name
+del _species, _name
+
+
+def _species_name(species: int) -> str:
+    """Display name for a species ID, or "Pokemon #N" if it has none."""
+    if species < len(_SPECIES_NAME_LIST):
+        return _SPECIES_NAME_LIST[species]
+    return f"Pokemon #{species}"
 
 
 # ==========================================================================
@@ -175,6 +211,15 @@ SPECIES_NAMES = {
 SAVEBLOCK1_PTR = 0x03005008  # → SaveBlock1 (position, flags, bag, money)
 SAVEBLOCK2_PTR = 0x0300500C  # → SaveBlock2 (player name, trainer ID, options)
 
+# Field offsets inside the save blocks:
+SB1_POSITION_OFFSET = 0x0000  # x (u16), y (u16), map group (u8), map number (u8)
+SB1_MONEY_OFFSET = 0x0290     # money (u32), followed by its XOR key (u32)
+SB1_BAG_OFFSET = 0x0310       # bag pockets, laid out back to back (see BAG_POCKETS)
+SB1_FLAGS_OFFSET = 0x0EE0     # event flags bit array
+BADGE_FLAG_START = 0x820      # first of the 8 consecutive badge flags
+SB2_NAME_LENGTH = 8           # player name: max 7 chars + terminator
+SB2_TRAINER_ID_OFFSET = 0x0A  # public ID (u16) + secret ID (u16)
+
 # Party data is stored directly in EWRAM at fixed addresses:
 PARTY_COUNT_ADDR = 0x02024029  # Number of Pokemon in party (0-6)
 PARTY_DATA_ADDR = 0x02024284   # Start of party Pokemon array
@@ -190,9 +235,23 @@ PARTY_MAX = 6         # Maximum party size
 # Bit 0 = double, bit 1 = link, bit 3 = trainer, bit 8 = wild.
 BATTLE_TYPE_FLAGS_ADDR = 0x02022B4C
 
+# Battle type for every combination of the bits above, resolved in priority
+# order (double > link > trainer > wild) so decoding is a single lookup.
+_BATTLE_TYPE_BITS = ((1 << 0, "double"), (1 << 1, "link"), (1 << 3, "trainer"), (1 << 8, "wild"))
+_BATTLE_TYPE_MASK = 0x10B
+_BATTLE_TYPES = {
+    bits: next((name for bit, name in _BATTLE_TYPE_BITS if bits & bit), "unknown")
+    for bits in range(_BATTLE_TYPE_MASK + 1)
+    if bits & _BATTLE_TYPE_MASK == bits
+}
+
 # gBattleOutcome: 1 byte set at end of battle.
 # 0=unresolved, 1=won, 2=lost, 3=ran, 4=caught, 5=draw, 6=opponent ran.
 BATTLE_OUTCOME_ADDR = 0x02023E8A
+BATTLE_OUTCOMES = {
+    0: "unresolved", 1: "won", 2: "lost",
+    3: "ran", 4: "caught", 5: "draw", 6: "opponent_ran",
+}
 
 # gBattleMons: array of 4 BattlePokemon structs (88 bytes each).
 # [0]=player slot 0, [1]=opponent slot 0, [2]=player slot 1, [3]=opponent slot 1
@@ -243,21 +302,57 @@ START_MENU_OPTIONS = {
 def decode_gen3_string(data: bytes, max_len: int | None = None) -> str:
     """Decode a Gen 3 encoded byte string into a Python string.
 
+    Results are memoized on the raw bytes, since the same names (player,
+    nicknames) are decoded over and over between changes.
+
     Args:
-        data: Raw bytes from GBA memory.
+        data: Raw bytes from GBA memory (any bytes-like object).
         max_len: Optional maximum number of bytes to process.
 
     Returns:
         Decoded string. Unknown bytes become '?'. Stops at 0xFF terminator.
     """
-    result = []
-    for i, b in enumerate(data):
-        if max_len and i >= max_len:
-            break
-        if b == 0xFF:  # string terminator
-            break
-        result.append(GEN3_CHARSET.get(b, "?"))
-    return "".join(result)
+    return _decode_gen3_string(bytes(data), max_len)
+
+
+@lru_cache(maxsize=256)
+def _decode_gen3_string(data: bytes, max_len: int | None) -> str:
+    """Memoized body of decode_gen3_string(); ``data`` must be bytes."""
+    if max_len:
+        data = data[:max_len]
+    data = data.split(b"\xff", 1)[0]  # cut at the string terminator
+
+    # One C-level pass through the byte table, then a second pass only if
+    # any multi-character/non-ASCII placeholders are present
+    text = data.translate(_GEN3_TABLE).decode("latin-1")
+    if text.isascii():
+        return text
+    return text.translate(_GEN3_SPECIAL)
+
+
+def decode_gen3_strings(data: bytes, width: int) -> list[str]:
+    """Decode a run of fixed-width Gen 3 string fields from one buffer.
+
+    Equivalent to calling decode_gen3_string() on every ``width``-byte
+    slice of ``data``, but the byte table is applied to the whole buffer
+    in a single translate() pass.
+
+    Args:
+        data: Raw bytes holding N consecutive fields of ``width`` bytes.
+        width: Size of each field in bytes (e.g. 10 for nicknames).
+
+    Returns:
+        List of N decoded strings. Each stops at its own 0xFF terminator.
+    """
+    # translate() is 1:1, so field boundaries in the text match the bytes;
+    # multi-character placeholders are only expanded after slicing
+    text = data.translate(_GEN3_TABLE).decode("latin-1")
+    strings = []
+    for start in range(0, len(data) - width + 1, width):
+        end = data.find(b"\xff", start, start + width)
+        field = text[start:end if end >= 0 else start + width]
+        strings.append(field if field.isascii() else field.translate(_GEN3_SPECIAL))
+    return strings
 
 
 # ==========================================================================
@@ -267,59 +362,168 @@ def decode_gen3_string(data: bytes, max_len: int | None = None) -> str:
 # editing. The 48 bytes of substructure data (offsets 32-79) are XOR'd with
 # a key, and the four 12-byte substructures are shuffled based on PID % 24.
 
-def _decrypt_substructures(data: bytes, pid: int, ot_id: int) -> dict[str, bytes]:
-    """Decrypt and re-order the four Pokemon data substructures.
+# One 12-byte substructure viewed as three 32-bit words
+_SUBSTRUCTURE_WORDS = struct.Struct("<3I")
+
+# The 24 possible orderings of the four substructures.
+# Index is PID % 24. Letters: G=Growth, A=Attacks, E=EVs, M=Misc
+SUBSTRUCTURE_ORDER = (
+    "GAEM", "GAME", "GEAM", "GEMA", "GMAE", "GMEA",
+    "AGEM", "AGME", "AEGM", "AEMG", "AMGE", "AMEG",
+    "EGAM", "EGMA", "EAGM", "EAMG", "EMGA", "EMAG",
+    "MGAE", "MGEA", "MAGE", "MAEG", "MEGA", "MEAG",
+)
+
+# Byte offsets of the (G, A, E, M) substructures within the 48 encrypted
+# bytes, precomputed for each of the 24 orderings.
+_SUBSTRUCTURE_OFFSETS = tuple(
+    tuple(order.index(letter) * 12 for letter in "GAEM")
+    for order in SUBSTRUCTURE_ORDER
+)
 
-    The encryption key is PID XOR OTID. Each 32-bit word in the 48-byte
-    encrypted region is XOR'd with this key. Then the four 12-byte
-    substructures are re-mapped to their canonical names (G, A, E, M)
-    based on the permutation index PID % 24.
+
+def _decrypt_substructure(encrypted: bytes, key: int, offset: int) -> bytes:
+    """Decrypt a single 12-byte substructure.
+
+    The encryption key is PID XOR OTID. Each 32-bit word in the encrypted
+    region is XOR'd with this key, so any one substructure can be decrypted
+    on its own without touching the other three.
 
     Args:
-        data: Full 100-byte party Pokemon data.
-        pid: Personality Value (bytes 0-3).
-        ot_id: Original Trainer ID (bytes 4-7).
+        encrypted: The 48 encrypted substructure bytes (offsets 32-79).
+        key: PID XOR OTID.
+        offset: Byte offset of the substructure within the 48 bytes, taken
+                from _SUBSTRUCTURE_OFFSETS[pid % 24].
 
     Returns:
-        Dict mapping substructure letter to its decrypted 12-byte contents:
-          "G" = Growth (species, held item, experience, friendship)
-          "A" = Attacks (4 moves + 4 PP values)
-          "E" = EVs/Condition (6 EV stats + contest conditions)
-          "M" = Miscellaneous (pokerus, met location, origin info)
+        The decrypted 12-byte substructure.
     """
-    key = pid ^ ot_id
-    encrypted = data[32:80]  # 48 bytes of encrypted substructure data
-
-    # Decrypt: XOR each 32-bit little-endian word with the key
-    decrypted = bytearray(48)
-    for i in range(0, 48, 4):
-        word = struct.unpack_from("<I", encrypted, i)[0]
-        word ^= key
-        struct.pack_into("<I", decrypted, i, word)
-
-    # The 24 possible orderings of the four substructures.
-    # Index is PID % 24. Letters: G=Growth, A=Attacks, E=EVs, M=Misc
-    SUBSTRUCTURE_ORDER = [
-        "GAEM", "GAME", "GEAM", "GEMA", "GMAE", "GMEA",
-        "AGEM", "AGME", "AEGM", "AEMG", "AMGE", "AMEG",
-        "EGAM", "EGMA", "EAGM", "EAMG", "EMGA", "EMAG",
-        "MGAE", "MGEA", "MAGE", "MAEG", "MEGA", "MEAG",
-    ]
-    order = SUBSTRUCTURE_ORDER[pid % 24]
-
-    # Map each position in the encrypted data to its substructure letter
-    subs = {}
-    for i, letter in enumerate(order):
-        subs[letter] = decrypted[i * 12:(i + 1) * 12]
-
-    return subs
+    words = _SUBSTRUCTURE_WORDS.unpack_from(encrypted, offset)
+    return _SUBSTRUCTURE_WORDS.pack(*[w ^ key for w in words])
 
 
 # ==========================================================================
 # POKEMON STRUCT PARSING
 # ==========================================================================
 
-def parse_party_pokemon(data: bytes) -> dict[str, Any] | None:
+# Precompiled layouts for the fields of a party Pokemon, so the format
+# strings are parsed once at import rather than on every read.
+#
+# _PARTY_MON covers the whole 100-byte struct in one unpack:
+#   pid, ot_id, nickname (10s), language/OT name/markings (14s),
+#   encrypted substructures (48s), status, level, (pad), HP, max HP,
+#   Atk, Def, Spd, SpA, SpD
+_PARTY_MON = struct.Struct("<II10s14s48sIBx7H")
+_GROWTH = struct.Struct("<HHI")            # species, held item, experience
+_ATTACKS = struct.Struct("<4H4B")          # 4 move IDs, 4 PP values
+_EVS = struct.Struct("<6B")                # HP, Atk, Def, Spd, SpA, SpD EVs
+_EV_NAMES = ("hp", "attack", "defense", "speed", "sp_attack", "sp_defense")
+
+# Single-field little-endian scalar, for reads at arbitrary offsets
+_U32 = struct.Struct("<I")
+
+# Fields read from an 88-byte BattlePokemon struct, unpacked in one call:
+# stats and species (0x00), moves (0x0C), PP (0x14), hp/level (0x28),
+# maxHP (0x2C), status1/status2 (0x4C). Padding skips the unused fields.
+_BATTLE_MON = struct.Struct("<6H4H4B16xHBxH30xII")
+
+# Field groups that parse_party_pokemon() can be asked for. Each group maps
+# to one part of the struct, so skipping a group skips decrypting/decoding
+# that part entirely:
+#   nickname — Gen 3 string decode of the nickname (done by the callers of
+#              _row_to_dict, so party blocks can decode all names at once)
+#   growth   — species_id, species_name, experience, held_item, friendship
+#   attacks  — moves (IDs + PP)
+#   evs      — the six EV values
+#   battle   — level, HP, stats and status (unencrypted, bytes 80-99)
+# pid and ot_id are always included.
+PARTY_MON_FIELDS = frozenset({"nickname", "growth", "attacks", "evs", "battle"})
+
+
+def _row_to_dict(row: tuple, fields: frozenset[str], nickname: str | None) -> dict[str, Any]:
+    """Build the parsed Pokemon dict from one unpacked _PARTY_MON row.
+
+    ``nickname`` is the already-decoded nickname, included in the dict when
+    the "nickname" group is requested.
+    """
+    (pid, ot_id, _nickname_raw, _ot_block, encrypted, status, level,
+     current_hp, max_hp, attack_stat, defense_stat, speed_stat,
+     sp_atk_stat, sp_def_stat) = row
+
+    key = pid ^ ot_id
+    g_off, a_off, e_off, _m_off = _SUBSTRUCTURE_OFFSETS[pid % 24]
+    mon: dict[str, Any] = {}
+
+    # Keys are filled in the same order as the full parse has always
+    # returned them, so the JSON output keeps its familiar layout.
+
+    # Growth substructure (12 bytes): species, held item, EXP, friendship
+    if "growth" in fields:
+        growth = _decrypt_substructure(encrypted, key, g_off)
+        species, held_item, experience = _GROWTH.unpack_from(growth, 0)
+        mon["species_id"] = species
+        mon["species_name"] = _species_name(species)
+
+    # -- Header (unencrypted) --
+    if "nickname" in fields:
+        mon["nickname"] = nickname
+
+    # -- Battle stats (bytes 80-99) --
+    # These are only calculated for party members (not PC-boxed Pokemon)
+    # and were already unpacked as part of the row.
+    if "battle" in fields:
+        mon["level"] = level
+        mon["hp"] = current_hp
+        mon["max_hp"] = max_hp
+        mon["attack"] = attack_stat
+        mon["defense"] = defense_stat
+        mon["speed"] = speed_stat
+        mon["sp_attack"] = sp_atk_stat
+        mon["sp_defense"] = sp_def_stat
+
+    if "growth" in fields:
+        mon["experience"] = experience
+        mon["held_item"] = held_item
+
+    # Attacks substructure (12 bytes): 4 move IDs (2 bytes each) + 4 PP (1 byte each)
+    if "attacks" in fields:
+        attacks = _ATTACKS.unpack(_decrypt_substructure(encrypted, key, a_off))
+        move_ids, pp = attacks[:4], attacks[4:]
+        moves = [{"id": move_id} for move_id in move_ids if move_id != 0]
+        for i, m in enumerate(moves):
+            m["pp"] = pp[i]
+        mon["moves"] = moves
+
+    # EVs/Condition substructure (12 bytes): 6 EV stats + contest conditions
+    if "evs" in fields:
+        evs_data = _decrypt_substructure(encrypted, key, e_off)
+        mon["evs"] = dict(zip(_EV_NAMES, _EVS.unpack_from(evs_data, 0)))
+
+    if "battle" in fields:
+        mon["status"] = status
+    if "growth" in fields:
+        mon["friendship"] = growth[9]
+
+    # The Misc substructure (pokerus, met location, origins) is not exposed,
+    # so it is never decrypted.
+
+    mon["pid"] = pid
+    mon["ot_id"] = ot_id
+    return mon
+
+
+def _check_fields(fields: set[str] | frozenset[str] | None) -> frozenset[str]:
+    """Normalize a ``fields`` argument, defaulting to every field group."""
+    if fields is None:
+        return PARTY_MON_FIELDS
+    fields = frozenset(fields)
+    unknown = fields - PARTY_MON_FIELDS
+    if unknown:
+        raise ValueError(f"unknown Pokemon field group(s): {', '.join(sorted(unknown))}")
+    return fields
+
+
+def parse_party_pokemon(data: bytes, fields: set[str] | frozenset[str] | None = None) -> dict[str, Any] | None:
     """Parse a 100-byte party Pokemon structure into a readable dict.
 
     Decrypts the substructures and extracts all key fields: species, level,
@@ -327,89 +531,203 @@ def parse_party_pokemon(data: bytes) -> dict[str, Any] | None:
 
     Args:
         data: Exactly 100 bytes of raw party Pokemon data.
+        fields: Optional subset of PARTY_MON_FIELDS to parse. Substructures
+                that aren't needed for the requested groups are never
+                decrypted. Defaults to all groups.
 
     Returns:
-        Dict with all parsed fields, or None if data is too short.
+        Dict with all parsed fields, or None if data is too short or the
+        slot is empty (PID and OT ID both zero).
     """
     if len(data) < PARTY_MON_SIZE:
         return None
+    fields = _check_fields(fields)
+    row = _PARTY_MON.unpack_from(data, 0)
+    if row[0] == 0 and row[1] == 0:
+        return None  # Empty slot — nothing to decrypt
+    nickname = decode_gen3_string(row[2]) if "nickname" in fields else None
+    return _row_to_dict(row, fields, nickname)
 
-    # -- Header (unencrypted) --
-    pid = struct.unpack_from("<I", data, 0)[0]       # Personality Value
-    ot_id = struct.unpack_from("<I", data, 4)[0]     # Original Trainer ID
-    nickname_raw = data[8:18]                         # 10 bytes, Gen 3 encoded
-    nickname = decode_gen3_string(nickname_raw)
 
-    # -- Decrypt and reorder the four substructures --
-    subs = _decrypt_substructures(data, pid, ot_id)
+def parse_party_block(data: bytes, fields: set[str] | frozenset[str] | None = None) -> list[dict[str, Any]]:
+    """Parse a contiguous run of 100-byte party Pokemon structures.
 
-    # Growth substructure (12 bytes): species, held item, EXP, friendship
-    growth = subs["G"]
-    species = struct.unpack_from("<H", growth, 0)[0]
-    held_item = struct.unpack_from("<H", growth, 2)[0]
-    experience = struct.unpack_from("<I", growth, 4)[0]
-    friendship = growth[9]
+    All slots are unpacked with a single struct.iter_unpack() pass over the
+    buffer, then each row is decrypted and turned into a dict. Any trailing
+    partial struct is ignored.
 
-    # Attacks substructure (12 bytes): 4 move IDs (2 bytes each) + 4 PP (1 byte each)
-    attacks = subs["A"]
-    moves = []
-    for i in range(4):
-        move_id = struct.unpack_from("<H", attacks, i * 2)[0]
-        if move_id != 0:
-            moves.append({"id": move_id})
-    pp = [attacks[8 + i] for i in range(4)]
-    for i, m in enumerate(moves):
-        m["pp"] = pp[i]
+    Args:
+        data: Raw bytes covering N consecutive party slots (N * 100 bytes).
+        fields: Optional subset of PARTY_MON_FIELDS to parse (see
+                parse_party_pokemon). Defaults to all groups.
 
-    # EVs/Condition substructure (12 bytes): 6 EV stats + contest conditions
-    evs_data = subs["E"]
-    evs = {
-        "hp": evs_data[0], "attack": evs_data[1], "defense": evs_data[2],
-        "speed": evs_data[3], "sp_attack": evs_data[4], "sp_defense": evs_data[5],
-    }
+    Returns:
+        List of parsed Pokemon dicts, one per slot, in slot order. Unlike
+        parse_party_pokemon(), empty slots (PID and OT ID both zero) are not
+        turned into None: every slot gets a dict (species 0 when empty), so
+        callers should only pass the slots covered by the party count.
+    """
+    fields = _check_fields(fields)
+    usable = len(data) - len(data) % PARTY_MON_SIZE
+    rows = list(_PARTY_MON.iter_unpack(data[:usable]))
+    if "nickname" in fields:
+        # Decode every nickname in the block with one translate() pass
+        nicknames = decode_gen3_strings(b"".join(row[2] for row in rows), 10)
+    else:
+        nicknames = [None] * len(rows)
+    return [_row_to_dict(row, fields, nick) for row, nick in zip(rows, nicknames)]
 
-    # Misc substructure (12 bytes): pokerus, met location, etc.
-    misc = subs["M"]
-    pokerus = misc[0]
-    met_location = misc[1]
 
-    # -- Battle stats (bytes 80-99) --
-    # These are only calculated for party members (not PC-boxed Pokemon).
-    status = struct.unpack_from("<I", data, 80)[0]       # Status condition flags
-    level = data[84]                                      # Current level
-    current_hp = struct.unpack_from("<H", data, 86)[0]   # Current HP
-    max_hp = struct.unpack_from("<H", data, 88)[0]       # Max HP
-    attack_stat = struct.unpack_from("<H", data, 90)[0]  # Attack
-    defense_stat = struct.unpack_from("<H", data, 92)[0] # Defense
-    speed_stat = struct.unpack_from("<H", data, 94)[0]   # Speed
-    sp_atk_stat = struct.unpack_from("<H", data, 96)[0]  # Sp. Attack
-    sp_def_stat = struct.unpack_from("<H", data, 98)[0]  # Sp. Defense
-
-    species_name = SPECIES_NAMES.get(species, f"Pokemon #{species}")
+def parse_battle_pokemon(data: bytes) -> dict[str, Any] | None:
+    """Parse an 88-byte BattlePokemon struct from the gBattleMons array.
+
+    The in-battle struct has a different layout from the 100-byte party
+    struct. It contains live battle stats (including stat stages, status,
+    and current HP) but is NOT encrypted.
+
+    Args:
+        data: At least 88 bytes of raw BattlePokemon data.
+
+    Returns:
+        Dict with species, level, HP, stats, moves, and status, or None if
+        data is too short.
+    """
+    if len(data) < BATTLE_MON_SIZE:
+        return None
+
+    # BattlePokemon struct layout (from pret/pokefirered include/pokemon.h):
+    # Offsets are from the struct's pokefirered decomp:
+    #   u16 species          @ 0x00
+    #   u16 attack           @ 0x02
+    #   u16 defense          @ 0x04
+    #   u16 speed            @ 0x06
+    #   u16 spAttack         @ 0x08
+    #   u16 spDefense        @ 0x0A
+    #   u16 moves[4]         @ 0x0C-0x13
+    #   u32 pp[4] (packed)   @ 0x14-0x17 (1 byte each)
+    #   ...
+    #   u16 hp               @ 0x28
+    #   u8  level            @ 0x2A
+    #   ...
+    #   u16 maxHP            @ 0x2C
+    #   ...
+    #   u32 status1          @ 0x4C  (primary status: burn, poison, etc.)
+    #   u32 status2          @ 0x50  (volatile: confused, flinch, etc.)
+
+    fields = _BATTLE_MON.unpack_from(data, 0)
+    species, attack, defense, speed, sp_attack, sp_defense = fields[0:6]
+    hp, level, max_hp, status1, status2 = fields[14:19]
+
+    # 4 move IDs (2 bytes each), each paired with its PP byte
+    moves = [
+        {"id": move_id, "pp": pp}
+        for move_id, pp in zip(fields[6:10], fields[10:14])
+        if move_id != 0
+    ]
 
     return {
         "species_id": species,
-        "species_name": species_name,
-        "nickname": nickname,
+        "species_name": _species_name(species),
         "level": level,
-        "hp": current_hp,
+        "hp": hp,
         "max_hp": max_hp,
-        "attack": attack_stat,
-        "defense": defense_stat,
-        "speed": speed_stat,
-        "sp_attack": sp_atk_stat,
-        "sp_defense": sp_def_stat,
-        "experience": experience,
-        "held_item": held_item,
+        "attack": attack,
+        "defense": defense,
+        "speed": speed,
+        "sp_attack": sp_attack,
+        "sp_defense": sp_defense,
         "moves": moves,
-        "evs": evs,
-        "status": status,
-        "friendship": friendship,
-        "pid": pid,
-        "ot_id": ot_id,
+        "status1": status1,
+        "status2": status2,
     }
 
 
+# ==========================================================================
+# SAVE BLOCK FIELD DECODING
+# ==========================================================================
+# Each helper turns the raw bytes of one save block field into its value,
+# so the same field can be read on its own or as part of a batched read.
+
+_SAVEBLOCK_PTRS = struct.Struct("<II")  # SaveBlock1 and SaveBlock2 pointers
+_POSITION = struct.Struct("<HHBB")
+_MONEY = struct.Struct("<II")
+
+BADGE_NAMES = (
+    "Boulder", "Cascade", "Thunder", "Rainbow",
+    "Soul", "Marsh", "Volcano", "Earth",
+)
+
+# The two flag bytes that hold the 8 badge bits (they may span a byte boundary)
+_BADGE_FLAGS_OFFSET = SB1_FLAGS_OFFSET + BADGE_FLAG_START // 8
+_BADGE_BIT_OFFSET = BADGE_FLAG_START % 8
+
+# Earned badge names for every possible 8-bit badge mask
+_BADGES_BY_MASK = tuple(
+    tuple(name for i, name in enumerate(BADGE_NAMES) if mask >> i & 1)
+    for mask in range(256)
+)
+
+
+def _decode_position(data: bytes) -> dict[str, int]:
+    """Decode the 6-byte position field at the start of SaveBlock1."""
+    x, y, map_group, map_num = _POSITION.unpack_from(data, 0)
+    return {
+        "x": x,
+        "y": y,
+        "map_group": map_group,
+        "map_num": map_num,
+    }
+
+
+def _decode_money(data: bytes) -> int:
+    """Decode the 8-byte money field (encrypted value + XOR key)."""
+    money_raw, money_key = _MONEY.unpack_from(data, 0)
+    return money_raw ^ money_key
+
+
+def _decode_badges(data: bytes) -> list[str]:
+    """Decode the two flag bytes holding the badge bits into badge names."""
+    badge_bits = (data[0] >> _BADGE_BIT_OFFSET) | ((data[1] << (8 - _BADGE_BIT_OFFSET)) & 0xFF)
+    return list(_BADGES_BY_MASK[badge_bits])
+
+
+# Fire Red bag pockets in SaveBlock1 order, with their slot capacities.
+# Each item slot is 4 bytes: 2-byte item ID + 2-byte quantity.
+BAG_POCKETS = (
+    ("items", 42),       # general consumables, held items
+    ("key_items", 30),   # quest items, bike, etc.
+    ("pokeballs", 16),   # all ball types
+    ("tms_hms", 64),     # technical/hidden machines
+    ("berries", 46),     # berry items
+)
+BAG_SLOT_SIZE = 4
+_BAG_SLOT = struct.Struct("<HH")  # item ID, quantity
+
+
+def _decode_bag_pocket(data: bytes) -> list[dict[str, int]]:
+    """Decode a run of 4-byte item slots, skipping empty (ID 0) slots."""
+    return [
+        {"id": item_id, "quantity": quantity}
+        for item_id, quantity in _BAG_SLOT.iter_unpack(data)
+        if item_id != 0
+    ]
+
+
+def _decode_party(count_data: bytes, data: bytes, fields: set[str] | None) -> list[dict[str, Any]]:
+    """Parse the party from its count byte and the raw bytes of all 6 slots."""
+    count = count_data[0]
+    if count == 0 or count > PARTY_MAX:
+        return []
+    return parse_party_block(data[:count * PARTY_MON_SIZE], fields)
+
+
+# Regions read_party() fetches: the count byte and every party slot
+_PARTY_REGIONS = [
+    (PARTY_COUNT_ADDR, 1),
+    (PARTY_DATA_ADDR, PARTY_MAX * PARTY_MON_SIZE),
+]
+
+
 # ==========================================================================
 # HIGH-LEVEL GAME STATE READER
 # ==========================================================================
@@ -426,30 +744,38 @@ class FireRedReader:
     def __init__(self, client: MGBAClient):
         self.client = client
 
+    def _read_saveblock_pointers(self) -> tuple[int, int]:
+        """Resolve the SaveBlock1 and SaveBlock2 pointers with one read.
+
+        The game relocates both save blocks whenever it resets its heap
+        (map warps, loading a save), so the pointers are deliberately not
+        cached between calls.
+        """
+        # SAVEBLOCK2_PTR immediately follows SAVEBLOCK1_PTR in IWRAM
+        pointers = self.client.read_range(SAVEBLOCK1_PTR, _SAVEBLOCK_PTRS.size)
+        return _SAVEBLOCK_PTRS.unpack(pointers)
+
     # -- Party --
 
     def read_party_count(self) -> int:
         """Read how many Pokemon are in the player's party (0-6)."""
         return self.client.read8(PARTY_COUNT_ADDR)
 
-    def read_party(self) -> list[dict[str, Any]]:
+    def read_party(self, fields: set[str] | None = None) -> list[dict[str, Any]]:
         """Read all Pokemon in the player's party with full details.
 
         Returns a list of dicts, one per party member, containing species,
         level, HP, stats, moves, EVs, and more. Empty party returns [].
-        """
-        count = self.read_party_count()
-        if count == 0 or count > PARTY_MAX:
-            return []
 
-        party = []
-        for i in range(count):
-            addr = PARTY_DATA_ADDR + i * PARTY_MON_SIZE
-            data = self.client.read_range(addr, PARTY_MON_SIZE)
-            mon = parse_party_pokemon(data)
-            if mon:
-                party.append(mon)
-        return party
+        Args:
+            fields: Optional subset of PARTY_MON_FIELDS to parse, for callers
+                    that only need part of each Pokemon (see
+                    parse_party_pokemon). Defaults to everything.
+        """
+        # Fetch the count and every party slot in one round-trip. All slots
+        # are contiguous, so they are parsed together from the same buffer.
+        count_data, data = self.client.read_many(_PARTY_REGIONS)
+        return _decode_party(count_data, data, fields)
 
     # -- Player position --
 
@@ -460,29 +786,21 @@ class FireRedReader:
         Map group + map number together identify which map the player is on.
         """
         sb1 = self.client.read32(SAVEBLOCK1_PTR)
-        x = self.client.read16(sb1 + 0x00)
-        y = self.client.read16(sb1 + 0x02)
-        map_group = self.client.read8(sb1 + 0x04)
-        map_num = self.client.read8(sb1 + 0x05)
-        return {
-            "x": x,
-            "y": y,
-            "map_group": map_group,
-            "map_num": map_num,
-        }
+        data = self.client.read_range(sb1 + SB1_POSITION_OFFSET, _POSITION.size)
+        return _decode_position(data)
 
     # -- Player identity --
 
     def read_player_name(self) -> str:
         """Read the player's trainer name from SaveBlock2."""
         sb2 = self.client.read32(SAVEBLOCK2_PTR)
-        name_data = self.client.read_range(sb2, 8)  # name is max 7 chars + terminator
+        name_data = self.client.read_range(sb2, SB2_NAME_LENGTH)
         return decode_gen3_string(name_data)
 
     def read_trainer_id(self) -> dict[str, int]:
         """Read the player's public and secret trainer IDs from SaveBlock2."""
         sb2 = self.client.read32(SAVEBLOCK2_PTR)
-        trainer_id_full = self.client.read32(sb2 + 0x0A)
+        trainer_id_full = self.client.read32(sb2 + SB2_TRAINER_ID_OFFSET)
         public_id = trainer_id_full & 0xFFFF
         secret_id = (trainer_id_full >> 16) & 0xFFFF
         return {"public_id": public_id, "secret_id": secret_id}
@@ -497,9 +815,7 @@ class FireRedReader:
         key, then XOR them to get the real amount.
         """
         sb1 = self.client.read32(SAVEBLOCK1_PTR)
-        money_raw = self.client.read32(sb1 + 0x0290)  # encrypted money
-        money_key = self.client.read32(sb1 + 0x0294)  # XOR key
-        return money_raw ^ money_key
+        return _decode_money(self.client.read_range(sb1 + SB1_MONEY_OFFSET, _MONEY.size))
 
     # -- Badges --
 
@@ -510,26 +826,8 @@ class FireRedReader:
         Fire Red badge flags start at flag 0x820 (8 badges total).
         """
         sb1 = self.client.read32(SAVEBLOCK1_PTR)
-        # The flags array starts at offset 0x0EE0 in SaveBlock1
-        flags_base = sb1 + 0x0EE0
-        badge_flag_start = 0x820
-        byte_offset = badge_flag_start // 8
-        bit_offset = badge_flag_start % 8
-
-        # Read two bytes to cover all 8 badge bits (they may span a byte boundary)
-        badge_byte = self.client.read8(flags_base + byte_offset)
-        badge_byte2 = self.client.read8(flags_base + byte_offset + 1)
-        badge_bits = (badge_byte >> bit_offset) | ((badge_byte2 << (8 - bit_offset)) & 0xFF)
-
-        badge_names = [
-            "Boulder", "Cascade", "Thunder", "Rainbow",
-            "Soul", "Marsh", "Volcano", "Earth",
-        ]
-        earned = []
-        for i, name in enumerate(badge_names):
-            if badge_bits & (1 << i):
-                earned.append(name)
-        return earned
+        # Read two bytes to cover all 8 badge bits
+        return _decode_badges(self.client.read_range(sb1 + _BADGE_FLAGS_OFFSET, 2))
 
     # -- Bag / Inventory --
 
@@ -539,13 +837,7 @@ class FireRedReader:
         Each item slot is 4 bytes: 2-byte item ID + 2-byte quantity.
         Empty slots have item ID 0 and are skipped.
         """
-        items = []
-        for i in range(capacity):
-            item_id = self.client.read16(pocket_addr + i * 4)
-            quantity = self.client.read16(pocket_addr + i * 4 + 2)
-            if item_id != 0:
-                items.append({"id": item_id, "quantity": quantity})
-        return items
+        return _decode_bag_pocket(self.client.read_range(pocket_addr, capacity * BAG_SLOT_SIZE))
 
     def read_bag(self) -> dict[str, list[dict[str, int]]]:
         """Read the contents of all five bag pockets.
@@ -556,21 +848,20 @@ class FireRedReader:
           - Pokeballs: 16 slots (all ball types)
           - TMs/HMs:   64 slots (technical/hidden machines)
           - Berries:   46 slots (berry items)
+
+        The pockets are contiguous, so the whole bag (198 slots) is fetched
+        in one read and split into pockets locally.
         """
         sb1 = self.client.read32(SAVEBLOCK1_PTR)
-        bag_offset = 0x0310  # start of bag data in SaveBlock1
+        total_slots = sum(capacity for _, capacity in BAG_POCKETS)
+        data = self.client.read_range(sb1 + SB1_BAG_OFFSET, total_slots * BAG_SLOT_SIZE)
 
         pockets = {}
-        pocket_info = [
-            ("items", 0, 42),
-            ("key_items", 42 * 4, 30),
-            ("pokeballs", (42 + 30) * 4, 16),
-            ("tms_hms", (42 + 30 + 16) * 4, 64),
-            ("berries", (42 + 30 + 16 + 64) * 4, 46),
-        ]
-        for name, offset, capacity in pocket_info:
-            pocket_addr = sb1 + bag_offset + offset
-            pockets[name] = self.read_bag_pocket(pocket_addr, capacity)
+        offset = 0
+        for name, capacity in BAG_POCKETS:
+            end = offset + capacity * BAG_SLOT_SIZE
+            pockets[name] = _decode_bag_pocket(data[offset:end])
+            offset = end
         return pockets
 
     # -- Battle state --
@@ -587,32 +878,23 @@ class FireRedReader:
         The primary detection is gBattleTypeFlags (0x02022B4C) — non-zero
         means a battle is in progress. The individual bits encode the type.
         """
-        flags = self.client.read32(BATTLE_TYPE_FLAGS_ADDR)
-        outcome_byte = self.client.read8(BATTLE_OUTCOME_ADDR)
+        # All three values come back from a single batched request
+        flags_data, outcome_data, count_data = self.client.read_many([
+            (BATTLE_TYPE_FLAGS_ADDR, 4),
+            (BATTLE_OUTCOME_ADDR, 1),
+            (BATTLERS_COUNT_ADDR, 1),
+        ])
+        flags = _U32.unpack(flags_data)[0]
+        outcome_byte = outcome_data[0]
 
         # Determine battle type from flags
         in_battle = flags != 0
-        if not in_battle:
-            battle_type = "none"
-        elif flags & (1 << 0):
-            battle_type = "double"
-        elif flags & (1 << 1):
-            battle_type = "link"
-        elif flags & (1 << 3):
-            battle_type = "trainer"
-        elif flags & (1 << 8):
-            battle_type = "wild"
-        else:
-            battle_type = "unknown"
+        battle_type = _BATTLE_TYPES[flags & _BATTLE_TYPE_MASK] if in_battle else "none"
 
         # Map outcome byte to human-readable string
-        outcome_map = {
-            0: "unresolved", 1: "won", 2: "lost",
-            3: "ran", 4: "caught", 5: "draw", 6: "opponent_ran",
-        }
-        outcome = outcome_map.get(outcome_byte, f"unknown({outcome_byte})")
+        outcome = BATTLE_OUTCOMES.get(outcome_byte, f"unknown({outcome_byte})")
 
-        battlers_count = self.client.read8(BATTLERS_COUNT_ADDR) if in_battle else 0
+        battlers_count = count_data[0] if in_battle else 0
 
         return {
             "in_battle": in_battle,
@@ -638,68 +920,35 @@ class FireRedReader:
             None if the read fails or data is empty.
         """
         addr = BATTLE_MONS_ADDR + battler_index * BATTLE_MON_SIZE
-        data = self.client.read_range(addr, BATTLE_MON_SIZE)
-
-        if len(data) < BATTLE_MON_SIZE:
-            return None
-
-        # BattlePokemon struct layout (from pret/pokefirered include/pokemon.h):
-        # Offsets are from the struct's pokefirered decomp:
-        #   u16 species          @ 0x00
-        #   u16 attack           @ 0x02
-        #   u16 defense          @ 0x04
-        #   u16 speed            @ 0x06
-        #   u16 spAttack         @ 0x08
-        #   u16 spDefense        @ 0x0A
-        #   u16 moves[4]         @ 0x0C-0x13
-        #   u32 pp[4] (packed)   @ 0x14-0x17 (1 byte each)
-        #   ...
-        #   u16 hp               @ 0x28
-        #   u8  level            @ 0x2A
-        #   ...
-        #   u16 maxHP            @ 0x2C
-        #   ...
-        #   u32 status1          @ 0x4C  (primary status: burn, poison, etc.)
-        #   u32 status2          @ 0x50  (volatile: confused, flinch, etc.)
-
-        species = struct.unpack_from("<H", data, 0x00)[0]
-        attack = struct.unpack_from("<H", data, 0x02)[0]
-        defense = struct.unpack_from("<H", data, 0x04)[0]
-        speed = struct.unpack_from("<H", data, 0x06)[0]
-        sp_attack = struct.unpack_from("<H", data, 0x08)[0]
-        sp_defense = struct.unpack_from("<H", data, 0x0A)[0]
-
-        # 4 move IDs (2 bytes each)
-        moves = []
-        for i in range(4):
-            move_id = struct.unpack_from("<H", data, 0x0C + i * 2)[0]
-            if move_id != 0:
-                moves.append({"id": move_id, "pp": data[0x14 + i]})
-
-        hp = struct.unpack_from("<H", data, 0x28)[0]
-        level = data[0x2A]
-        max_hp = struct.unpack_from("<H", data, 0x2C)[0]
-
-        status1 = struct.unpack_from("<I", data, 0x4C)[0]
-        status2 = struct.unpack_from("<I", data, 0x50)[0]
-
-        species_name = SPECIES_NAMES.get(species, f"Pokemon #{species}")
+        return parse_battle_pokemon(self.client.read_range(addr, BATTLE_MON_SIZE))
 
-        return {
-            "species_id": species,
-            "species_name": species_name,
-            "level": level,
-            "hp": hp,
-            "max_hp": max_hp,
-            "attack": attack,
-            "defense": defense,
-            "speed": speed,
-            "sp_attack": sp_attack,
-            "sp_defense": sp_defense,
-            "moves": moves,
-            "status1": status1,
-            "status2": status2,
-        }
+    def read_opponent_battlers(self) -> list[dict[str, Any]]:
+        """Read the opponent's active Pokemon, or [] when not in battle.
+
+        Returns opponent slot 1 in singles, or slots 1 and 3 in doubles.
+        The battle flags, battler count and gBattleMons entries 1-3 are all
+        fetched in one batched request and parsed locally.
+        """
+        flags_data, count_data, mons_data = self.client.read_many([
+            (BATTLE_TYPE_FLAGS_ADDR, 4),
+            (BATTLERS_COUNT_ADDR, 1),
+            (BATTLE_MONS_ADDR + BATTLE_MON_SIZE, 3 * BATTLE_MON_SIZE),
+        ])
+        if _U32.unpack(flags_data)[0] == 0:
+            return []
+
+        # In singles, opponent is slot 1. In doubles, also slot 3.
+        opponent_slots = [1]
+        if count_data[0] >= 4:
+            opponent_slots.append(3)
+
+        result = []
+        for slot in opponent_slots:
+            offset = (slot - 1) * BATTLE_MON_SIZE
+            mon = parse_battle_pokemon(mons_data[offset:offset + BATTLE_MON_SIZE])
+            if mon and mon["species_id"] != 0:
+                result.append(mon)
+        return result
 
     def read_opponent_party(self) -> list[dict[str, Any]]:
         """Read the enemy trainer's full party during a battle.
@@ -711,14 +960,16 @@ class FireRedReader:
             List of parsed Pokemon dicts (same format as read_party).
         """
         # Enemy party count is at ENEMY_PARTY_ADDR - 3 (mirroring player layout)
-        # But we can also just read all 6 slots and skip empty ones
+        # But we can also just read all 6 slots and stop at the first empty
+        # one, since the game fills party slots in order. The slots are
+        # contiguous, so fetch them in one request.
+        data = self.client.read_range(ENEMY_PARTY_ADDR, PARTY_MAX * PARTY_MON_SIZE)
         party = []
-        for i in range(PARTY_MAX):
-            addr = ENEMY_PARTY_ADDR + i * PARTY_MON_SIZE
-            data = self.client.read_range(addr, PARTY_MON_SIZE)
-            mon = parse_party_pokemon(data)
-            if mon and mon["species_id"] != 0:
-                party.append(mon)
+        for i in range(0, len(data), PARTY_MON_SIZE):
+            mon = parse_party_pokemon(data[i:i + PARTY_MON_SIZE])
+            if not mon or mon["species_id"] == 0:
+                break
+            party.append(mon)
         return party
 
     # -- Start menu --
@@ -734,11 +985,14 @@ class FireRedReader:
             Dict with cursor_pos, num_items, menu_order (list of option names),
             and selected_item (the option name the cursor is currently on).
         """
-        cursor_pos = self.client.read8(START_MENU_CURSOR_POS_ADDR)
-        num_items = self.client.read8(START_MENU_NUM_ITEMS_ADDR)
-
-        # Read the order array (up to 9 bytes, but only num_items are valid)
-        order_data = self.client.read_range(START_MENU_ORDER_ADDR, 9)
+        # The cursor (1 byte), item count (1 byte) and order array (up to 9
+        # bytes, but only num_items are valid) are adjacent, so read them
+        # together
+        order_offset = START_MENU_ORDER_ADDR - START_MENU_CURSOR_POS_ADDR
+        data = self.client.read_range(START_MENU_CURSOR_POS_ADDR, order_offset + 9)
+        cursor_pos = data[0]
+        num_items = data[START_MENU_NUM_ITEMS_ADDR - START_MENU_CURSOR_POS_ADDR]
+        order_data = data[order_offset:]
 
         # Build the display list of option names
         menu_order = []
@@ -765,8 +1019,23 @@ class FireRedReader:
 
         Returns player name, position, badges, money, and a condensed
         party summary (species + level + HP). Useful for quick status checks.
+
+        Both save block pointers are resolved together, then every field is
+        fetched with a single batched read, so a snapshot costs two requests.
         """
-        party = self.read_party()
+        sb1, sb2 = self._read_saveblock_pointers()
+        (name_data, position_data, money_data, badge_data,
+         count_data, party_data) = self.client.read_many([
+            (sb2, SB2_NAME_LENGTH),
+            (sb1 + SB1_POSITION_OFFSET, _POSITION.size),
+            (sb1 + SB1_MONEY_OFFSET, _MONEY.size),
+            (sb1 + _BADGE_FLAGS_OFFSET, 2),
+            *_PARTY_REGIONS,
+        ])
+
+        # The summary only needs species, level and HP, so skip decrypting
+        # moves/EVs and decoding nicknames
+        party = _decode_party(count_data, party_data, {"growth", "battle"})
         party_summary = []
         for mon in party:
             party_summary.append({
@@ -776,10 +1045,10 @@ class FireRedReader:
             })
 
         return {
-            "player_name": self.read_player_name(),
-            "position": self.read_player_position(),
-            "badges": self.read_badges(),
-            "money": self.read_money(),
+            "player_name": decode_gen3_string(name_data),
+            "position": _decode_position(position_data),
+            "badges": _decode_badges(badge_data),
+            "money": _decode_money(money_data),
             "party_count": len(party),
             "party": party_summary,
         }
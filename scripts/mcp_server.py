@@ -212,21 +212,7 @@ def get_opponent_pokemon() -> list[dict]:
         List of dicts with species, level, HP, stats, moves, and status
         for each opponent Pokemon currently in battle.
     """
-    battle = _get_reader().read_battle_state()
-    if not battle["in_battle"]:
-        return []
-
-    result = []
-    # In singles, opponent is slot 1. In doubles, also slot 3.
-    opponent_slots = [1]
-    if battle["battlers_count"] >= 4:
-        opponent_slots.append(3)
-
-    for slot in opponent_slots:
-        mon = _get_reader().read_battle_pokemon(slot)
-        if mon and mon["species_id"] != 0:
-            result.append(mon)
-    return result
+    return _get_reader().read_opponent_battlers()
 
 
 @mcp.tool()
@@ -268,11 +254,14 @@ def save_game() -> str:
     """Perform an in-game save by navigating the START menu.
 
     This navigates the in-game menu to Save (not an emulator save state).
-    It opens the START menu, resets cursor to the top, navigates down to
-    Save, and confirms the save dialog. Takes ~5 seconds of game time.
+    It opens the START menu, moves the cursor to Save, and confirms the
+    save dialog. Takes ~5 seconds of game time.
 
-    The menu order is: Pokedex(0), Pokemon(1), Bag(2), Player(3), Save(4), Option(5), Exit(6).
-    To reliably reach Save, we reset to top first then press DOWN 4 times.
+    Once the menu is open, the cursor position and displayed menu order are
+    read from memory so the cursor moves straight to Save. If Save isn't
+    found there, it falls back to resetting to the top and pressing DOWN 4
+    times (standard order: Pokedex(0), Pokemon(1), Bag(2), Player(3),
+    Save(4), Option(5), Exit(6)).
 
     Returns:
         Status message indicating save was initiated.
@@ -280,39 +269,35 @@ def save_game() -> str:
     client = _get_client()
 
     # Step 1: Open the START menu
-    client.press_button("START", 10)
-    client.run_frames(30)  # Wait for menu animation
-
-    # Step 2: Reset cursor to top by pressing UP enough times (max 8 items)
-    for _ in range(8):
-        client.press_button("UP", 6)
-        client.run_frames(8)
-
-    # Step 3: Navigate down to Save (index 4 in standard menu order)
-    for _ in range(4):
-        client.press_button("DOWN", 6)
-        client.run_frames(8)
+    client.press_sequence([("START", 10, 30)])  # Wait for menu animation
+
+    # Steps 2-3: Move the cursor to Save. The rest of the menu walk is sent
+    # as one (button, frames, wait) sequence.
+    menu = _get_reader().read_start_menu_state()
+    if "SAVE" in menu["menu_order"] and menu["cursor_pos"] < len(menu["menu_order"]):
+        moves = menu["menu_order"].index("SAVE") - menu["cursor_pos"]
+        steps = [("DOWN" if moves > 0 else "UP", 6, 8)] * abs(moves)
+    else:
+        # Unknown menu layout: reset cursor to top by pressing UP enough
+        # times (max 8 items), then navigate down to Save (index 4)
+        steps = [("UP", 6, 8)] * 8 + [("DOWN", 6, 8)] * 4
 
     # Step 4: Press A to select Save
-    client.press_button("A", 10)
-    client.run_frames(60)  # Wait for "Would you like to save?" dialog
+    steps.append(("A", 10, 60))  # Wait for "Would you like to save?" dialog
 
     # Step 5: Press A to confirm save
-    client.press_button("A", 10)
-    client.run_frames(120)  # Wait for save to write (~2 seconds)
+    steps.append(("A", 10, 120))  # Wait for save to write (~2 seconds)
 
     # Step 6: Press A to confirm overwrite (if previous save exists)
-    client.press_button("A", 10)
-    client.run_frames(120)  # Wait for save completion
+    steps.append(("A", 10, 120))  # Wait for save completion
 
     # Step 7: Press A to dismiss "saved the game" message
-    client.press_button("A", 10)
-    client.run_frames(30)
+    steps.append(("A", 10, 30))
 
     # Step 8: Press B to close any remaining menu
-    client.press_button("B", 10)
-    client.run_frames(20)
+    steps.append(("B", 10, 20))
 
+    client.press_sequence(steps)
     return "In-game save completed. Use get_screenshot to verify the save was successful."
 
 
@@ -324,9 +309,9 @@ def save_game() -> str:
 @mcp.tool()
 def press_button(button: str, frames: int = 10) -> str:
     """Press a single button for N frames. Valid buttons: A, B, START, SELECT, UP, DOWN, LEFT, RIGHT, L, R."""
-    _get_client().press_button(button, frames)
-    # Wait for the press to complete plus a small buffer for the game to react
-    _get_client().run_frames(frames + 2)
+    # Hold the button, then wait for the press to complete plus a small
+    # buffer for the game to react, all in one server-side sequence
+    _get_client().press_sequence([(button, frames, frames + 2)])
     return f"Pressed {button} for {frames} frames"
 
 
@@ -338,10 +323,7 @@ def press_sequence(buttons: list[str], frame_delay: int = 12) -> str:
         buttons: List of button names (e.g. ["A", "UP", "UP", "A"])
         frame_delay: Frames to wait between button presses (default 12)
     """
-    client = _get_client()
-    for button in buttons:
-        client.press_button(button, 10)
-        client.run_frames(frame_delay)
+    _get_client().press_sequence([(button, 10, frame_delay) for button in buttons])
     return f"Pressed sequence: {', '.join(buttons)}"
 
 
@@ -357,12 +339,9 @@ def walk(direction: str, steps: int = 1) -> str:
     if direction not in ("UP", "DOWN", "LEFT", "RIGHT"):
         return f"Invalid direction: {direction}. Use UP, DOWN, LEFT, or RIGHT."
 
-    client = _get_client()
     # The player moves at 1 tile per 16 frames when walking.
     # We hold the direction for 16 frames, then wait 2 extra for the step to register.
-    for _ in range(steps):
-        client.press_button(direction, 16)
-        client.run_frames(18)
+    _get_client().press_sequence([(direction, 16, 18)] * steps)
     return f"Walked {direction} {steps} step(s)"
 
 
@@ -401,6 +380,11 @@ def run_frames(count: int = 60) -> str:
 # ==========================================================================
 # Direct memory access for advanced use or debugging.
 
+# Typed client accessors keyed by access size in bytes
+_READ_METHODS = {1: MGBAClient.read8, 2: MGBAClient.read16, 4: MGBAClient.read32}
+_WRITE_METHODS = {1: MGBAClient.write8, 2: MGBAClient.write16, 4: MGBAClient.write32}
+
+
 @mcp.tool()
 def read_memory(address: int, size: int = 1) -> dict:
     """Read raw memory from the GBA. Size must be 1, 2, or 4 bytes, or use 'range' for arbitrary lengths.
@@ -410,16 +394,12 @@ def read_memory(address: int, size: int = 1) -> dict:
         size: Number of bytes to read (1, 2, or 4 for typed reads)
     """
     client = _get_client()
-    if size == 1:
-        return {"address": hex(address), "value": client.read8(address)}
-    elif size == 2:
-        return {"address": hex(address), "value": client.read16(address)}
-    elif size == 4:
-        return {"address": hex(address), "value": client.read32(address)}
-    else:
-        # For arbitrary sizes, read as a byte range and return both hex and list
-        data = client.read_range(address, size)
-        return {"address": hex(address), "hex": data.hex(), "bytes": list(data)}
+    read = _READ_METHODS.get(size)
+    if read is not None:
+        return {"address": hex(address), "value": read(client, address)}
+    # For arbitrary sizes, read as a byte range and return both hex and list
+    data = client.read_range(address, size)
+    return {"address": hex(address), "hex": data.hex(), "bytes": list(data)}
 
 
 @mcp.tool()
@@ -431,15 +411,10 @@ def write_memory(address: int, value: int, size: int = 1) -> str:
         value: Value to write
         size: Number of bytes (1, 2, or 4)
     """
-    client = _get_client()
-    if size == 1:
-        client.write8(address, value)
-    elif size == 2:
-        client.write16(address, value)
-    elif size == 4:
-        client.write32(address, value)
-    else:
+    write = _WRITE_METHODS.get(size)
+    if write is None:
         return f"Invalid size: {size}. Use 1, 2, or 4."
+    write(_get_client(), address, value)
     return f"Wrote {value} ({size} byte(s)) to {hex(address)}"
 
 
@@ -22,6 +22,7 @@ Usage:
         screenshot_b64 = client.screenshot()
 """
 
+import base64
 import json
 import socket
 from typing import Any
@@ -47,7 +48,8 @@ class MGBAClient:
         self.port = port
         self.timeout = timeout
         self._sock: socket.socket | None = None  # Active TCP socket
-        self._buffer = b""                        # Incomplete data from previous reads
+        self._buffer = bytearray()                # Incomplete data from previous reads
+        self._recv_view = memoryview(bytearray(65536))  # Reused socket receive area
         self._request_id = 0                      # Monotonic counter for request correlation
 
     # ------------------------------------------------------------------
@@ -66,9 +68,15 @@ class MGBAClient:
             except OSError:
                 pass
         self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Requests are small and each one waits for its reply, so disable
+        # Nagle's algorithm to send them immediately
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # The connection is held for the whole MCP session; let the OS notice
+        # if the emulator side silently goes away
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
         self._sock.settimeout(self.timeout)
         self._sock.connect((self.host, self.port))
-        self._buffer = b""
+        self._buffer = bytearray()
 
     def disconnect(self):
         """Close the TCP connection."""
@@ -88,13 +96,18 @@ class MGBAClient:
     # Core request/response
     # ------------------------------------------------------------------
 
-    def _send_command(self, cmd: dict[str, Any]) -> dict[str, Any]:
+    def _send_command(self, cmd: dict[str, Any], timeout: float | None = None) -> dict[str, Any]:
         """Send a JSON command and block until the matching response arrives.
 
         Each command gets a unique "id" field so we can correlate responses
         even if the server sends them out of order (e.g., deferred runFrames).
 
         If the send fails (broken pipe), attempts a single reconnect.
+
+        Args:
+            cmd: The command dict to send.
+            timeout: Optional socket timeout for this response only, for
+                     deferred commands that can outlast the default timeout.
         """
         self._ensure_connected()
         self._request_id += 1
@@ -109,7 +122,13 @@ class MGBAClient:
             self.connect()
             self._sock.sendall(data.encode("utf-8"))
 
-        return self._read_response(self._request_id)
+        if timeout is None:
+            return self._read_response(self._request_id)
+        self._sock.settimeout(timeout)
+        try:
+            return self._read_response(self._request_id)
+        finally:
+            self._sock.settimeout(self.timeout)
 
     def _read_response(self, request_id: int) -> dict[str, Any]:
         """Read from the socket until we find the response matching our request ID.
@@ -122,55 +141,85 @@ class MGBAClient:
             # Check if we already have a complete line in the buffer
             nl = self._buffer.find(b"\n")
             if nl >= 0:
-                line = self._buffer[:nl]
-                self._buffer = self._buffer[nl + 1:]
-                resp = json.loads(line.decode("utf-8"))
+                # Consume the line in place rather than re-copying the tail
+                resp = json.loads(self._buffer[:nl])
+                del self._buffer[:nl + 1]
                 # Match by request ID, or accept responses without an ID
                 if resp.get("id") == request_id or "id" not in resp:
                     return resp
                 continue  # Not our response; keep reading
 
             # No complete line yet — read more data from the socket
-            chunk = self._sock.recv(4096)
-            if not chunk:
+            # Receive into the reusable area (large enough that a full
+            # party/bag read arrives in one call) and append to the buffer
+            n = self._sock.recv_into(self._recv_view)
+            if not n:
                 raise ConnectionError("mGBA server closed connection")
-            self._buffer += chunk
+            self._buffer += self._recv_view[:n]
 
     # ------------------------------------------------------------------
     # Memory read operations
     # ------------------------------------------------------------------
 
-    def read8(self, addr: int) -> int:
-        """Read a single byte (8-bit) from GBA memory."""
-        resp = self._send_command({"cmd": "read8", "addr": addr})
+    def _read_typed(self, cmd: str, addr: int) -> int:
+        """Send a read8/read16/read32 command and return its integer value."""
+        resp = self._send_command({"cmd": cmd, "addr": addr})
         if not resp.get("ok"):
-            raise RuntimeError(resp.get("error", "read8 failed"))
+            raise RuntimeError(resp.get("error", f"{cmd} failed"))
         return resp["value"]
 
+    def read8(self, addr: int) -> int:
+        """Read a single byte (8-bit) from GBA memory."""
+        return self._read_typed("read8", addr)
+
     def read16(self, addr: int) -> int:
         """Read a 16-bit little-endian value from GBA memory."""
-        resp = self._send_command({"cmd": "read16", "addr": addr})
-        if not resp.get("ok"):
-            raise RuntimeError(resp.get("error", "read16 failed"))
-        return resp["value"]
+        return self._read_typed("read16", addr)
 
     def read32(self, addr: int) -> int:
         """Read a 32-bit little-endian value from GBA memory."""
-        resp = self._send_command({"cmd": "read32", "addr": addr})
-        if not resp.get("ok"):
-            raise RuntimeError(resp.get("error", "read32 failed"))
-        return resp["value"]
+        return self._read_typed("read32", addr)
 
     def read_range(self, addr: int, length: int) -> bytes:
         """Read N contiguous bytes from GBA memory.
 
-        Returns a Python bytes object. The Lua server returns the data as a
-        hex string which we decode here.
+        Returns a Python bytes object. The data is requested base64 encoded
+        (a third smaller than hex); servers that don't support that still
+        answer with a hex string, so both are decoded here.
         """
-        resp = self._send_command({"cmd": "readRange", "addr": addr, "length": length})
+        resp = self._send_command(
+            {"cmd": "readRange", "addr": addr, "length": length, "encoding": "base64"}
+        )
         if not resp.get("ok"):
             raise RuntimeError(resp.get("error", "readRange failed"))
-        return bytes.fromhex(resp["value"])
+        return self._decode_range(resp, resp["value"])
+
+    def read_many(self, regions: list[tuple[int, int]]) -> list[bytes]:
+        """Read several memory ranges in a single request.
+
+        Every range costs a full round-trip to the Lua server when read
+        separately, so callers that need a handful of unrelated regions
+        should batch them here instead of calling read_range repeatedly.
+
+        Args:
+            regions: List of (address, length) pairs.
+
+        Returns:
+            One bytes object per region, in the same order.
+        """
+        resp = self._send_command(
+            {"cmd": "readMany", "ranges": [list(r) for r in regions], "encoding": "base64"}
+        )
+        if not resp.get("ok"):
+            raise RuntimeError(resp.get("error", "readMany failed"))
+        return [self._decode_range(resp, v) for v in resp["value"]]
+
+    @staticmethod
+    def _decode_range(resp: dict[str, Any], value: str) -> bytes:
+        """Decode one range value using the encoding the server reported."""
+        if resp.get("encoding") == "base64":
+            return base64.b64decode(value)
+        return bytes.fromhex(value)
 
     # ------------------------------------------------------------------
     # Memory write operations
@@ -213,6 +262,33 @@ class MGBAClient:
         if not resp.get("ok"):
             raise RuntimeError(resp.get("error", "press failed"))
 
+    def press_sequence(self, steps: list[tuple[str, int, int]]):
+        """Play back a series of timed button presses, blocking until done.
+
+        The whole sequence is sent as one command and timed by the Lua
+        server frame by frame, instead of one press + runFrames round-trip
+        per step.
+
+        Args:
+            steps: List of (button, frames, wait) tuples. Each button is held
+                   for `frames` frames, and the next step starts `wait`
+                   frames after this one (so `wait` should be >= `frames`).
+        """
+        total_frames = sum(wait for _, _, wait in steps)
+        resp = self._send_command(
+            {
+                "cmd": "sequence",
+                "steps": [
+                    {"button": button, "frames": frames, "wait": wait}
+                    for button, frames, wait in steps
+                ],
+            },
+            # Allow for the sequence's own running time (~60 frames/second)
+            timeout=self.timeout + total_frames / 60,
+        )
+        if not resp.get("ok"):
+            raise RuntimeError(resp.get("error", "sequence failed"))
+
     def get_keys(self) -> list[str]:
         """Get the list of buttons currently held down by the player."""
         resp = self._send_command({"cmd": "getKeys"})
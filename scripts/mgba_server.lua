@@ -17,9 +17,11 @@
 --
 -- SUPPORTED COMMANDS:
 --   read8, read16, read32   — read 1/2/4 bytes from a GBA memory address
---   readRange               — read N bytes as a hex string
+--   readRange               — read N bytes as a hex (or base64) string
+--   readMany                — read several [addr, length] ranges in one request
 --   write8, write16, write32 — write 1/2/4 bytes to a GBA memory address
 --   press                   — hold a button for N frames
+--   sequence                — play back a list of timed button presses (deferred response)
 --   screenshot              — capture frame as base64 PNG
 --   saveState / loadState   — save/load emulator state slots
 --   runFrames               — advance emulation by N frames (deferred response)
@@ -37,6 +39,8 @@
 --   emu:addKey() each frame until their duration expires. Frame-advance
 --   requests are queued into `pending_frames` and count down each frame;
 --   the response is only sent once the requested number of frames has elapsed.
+--   Button sequences are queued into `pending_sequences` and feed their
+--   steps into `pending_presses` one at a time, responding when finished.
 --
 -- REQUIREMENTS:
 --   mGBA 0.10+ with scripting enabled. No external Lua libraries needed —
@@ -90,6 +94,13 @@ local pending_presses = {}
 -- The response is sent only after the countdown reaches zero.
 local pending_frames = {}
 
+-- Queue of button sequences being played back.
+-- Each entry: {client = socket, id = request_id, steps = {...}, index = N,
+--              frames_remaining = N}
+-- Each step is {key = GBA_KEY_CONSTANT, frames = N, wait = N}: hold the key
+-- for `frames` frames and start the next step `wait` frames after this one.
+local pending_sequences = {}
+
 
 -- ==========================================================================
 -- JSON ENCODER / DECODER
@@ -281,6 +292,61 @@ local function send_response(sock, resp)
 end
 
 
+-- Base64 encode a binary string (used for screenshots and memory ranges).
+local function base64_encode(data)
+    local b64chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+    local encoded = {}
+    for i = 1, #data, 3 do
+        local b1 = data:byte(i) or 0
+        local b2 = data:byte(i + 1) or 0
+        local b3 = data:byte(i + 2) or 0
+        -- Combine 3 bytes into a 24-bit number, then split into 4 6-bit indices
+        local n = b1 * 65536 + b2 * 256 + b3
+        table.insert(encoded, b64chars:sub(math.floor(n / 262144) % 64 + 1, math.floor(n / 262144) % 64 + 1))
+        table.insert(encoded, b64chars:sub(math.floor(n / 4096) % 64 + 1, math.floor(n / 4096) % 64 + 1))
+        if i + 1 <= #data then
+            table.insert(encoded, b64chars:sub(math.floor(n / 64) % 64 + 1, math.floor(n / 64) % 64 + 1))
+        else
+            table.insert(encoded, "=") -- padding
+        end
+        if i + 2 <= #data then
+            table.insert(encoded, b64chars:sub(n % 64 + 1, n % 64 + 1))
+        else
+            table.insert(encoded, "=") -- padding
+        end
+    end
+    return table.concat(encoded)
+end
+
+-- Read `length` bytes starting at `addr` and return them as a hex string.
+-- e.g., read_hex(0x02000000, 4) → "a1b2c3d4"
+local function read_hex(addr, length)
+    local bytes = {}
+    for i = 0, length - 1 do
+        bytes[i + 1] = string.format("%02x", emu:read8(addr + i))
+    end
+    return table.concat(bytes)
+end
+
+-- Read `length` bytes starting at `addr` and return them base64 encoded,
+-- which is a third smaller on the wire than hex.
+local function read_base64(addr, length)
+    local bytes = {}
+    for i = 0, length - 1 do
+        bytes[i + 1] = string.char(emu:read8(addr + i))
+    end
+    return base64_encode(table.concat(bytes))
+end
+
+-- Pick the range encoder for a request: base64 if asked for, else hex.
+local function range_reader(req)
+    if req.encoding == "base64" then
+        return read_base64, "base64"
+    end
+    return read_hex, "hex"
+end
+
+
 -- ==========================================================================
 -- COMMAND HANDLER
 -- ==========================================================================
@@ -311,13 +377,21 @@ local function handle_command(sock, req)
         return {ok = true, value = val}
 
     elseif cmd == "readRange" then
-        -- Read N bytes starting at addr, return as hex string
-        -- e.g., readRange(0x02000000, 4) → "a1b2c3d4"
-        local bytes = {}
-        for i = 0, (req.length or 1) - 1 do
-            bytes[i + 1] = string.format("%02x", emu:read8(req.addr + i))
+        -- Read N bytes starting at addr, return as a hex string, or base64
+        -- if the request has "encoding": "base64"
+        local read, encoding = range_reader(req)
+        return {ok = true, value = read(req.addr, req.length or 1), encoding = encoding}
+
+    elseif cmd == "readMany" then
+        -- Read a list of [addr, length] ranges in a single round-trip.
+        -- Returns one string per range, in request order, encoded as for
+        -- readRange.
+        local read, encoding = range_reader(req)
+        local values = {}
+        for i, range in ipairs(req.ranges or {}) do
+            values[i] = read(range[1], range[2])
         end
-        return {ok = true, value = table.concat(bytes)}
+        return {ok = true, value = values, encoding = encoding}
 
     -- ----- Memory writes -----
     elseif cmd == "write8" then
@@ -345,6 +419,28 @@ local function handle_command(sock, req)
         table.insert(pending_presses, {key = gba_key, frames_remaining = frames})
         return {ok = true}
 
+    elseif cmd == "sequence" then
+        -- Deferred response: play back a list of {button, frames, wait}
+        -- steps from on_frame() and respond once the last wait has elapsed.
+        -- Every button is validated up front so a bad step rejects the
+        -- whole sequence before anything is pressed.
+        local steps = {}
+        for n, step in ipairs(req.steps or {}) do
+            local gba_key = BUTTON_MAP[string.upper(step.button or "")]
+            if not gba_key then
+                return {ok = false, error = "unknown button: " .. (step.button or "nil")}
+            end
+            steps[n] = {key = gba_key, frames = step.frames or 10, wait = step.wait or 0}
+        end
+        table.insert(pending_sequences, {
+            client = sock,
+            id = req.id,
+            steps = steps,
+            index = 0,
+            frames_remaining = 0
+        })
+        return nil -- nil signals "don't send response now"
+
     -- ----- Screenshot -----
     elseif cmd == "screenshot" then
         -- Capture current frame: save to temp file, read back, base64 encode.
@@ -360,28 +456,7 @@ local function handle_command(sock, req)
         os.remove(tmp) -- clean up temp file
 
         -- Base64 encode the PNG binary data
-        local b64chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
-        local encoded = {}
-        for i = 1, #data, 3 do
-            local b1 = data:byte(i) or 0
-            local b2 = data:byte(i + 1) or 0
-            local b3 = data:byte(i + 2) or 0
-            -- Combine 3 bytes into a 24-bit number, then split into 4 6-bit indices
-            local n = b1 * 65536 + b2 * 256 + b3
-            table.insert(encoded, b64chars:sub(math.floor(n / 262144) % 64 + 1, math.floor(n / 262144) % 64 + 1))
-            table.insert(encoded, b64chars:sub(math.floor(n / 4096) % 64 + 1, math.floor(n / 4096) % 64 + 1))
-            if i + 1 <= #data then
-                table.insert(encoded, b64chars:sub(math.floor(n / 64) % 64 + 1, math.floor(n / 64) % 64 + 1))
-            else
-                table.insert(encoded, "=") -- padding
-            end
-            if i + 2 <= #data then
-                table.insert(encoded, b64chars:sub(n % 64 + 1, n % 64 + 1))
-            else
-                table.insert(encoded, "=") -- padding
-            end
-        end
-        return {ok = true, value = table.concat(encoded)}
+        return {ok = true, value = base64_encode(data)}
 
     -- ----- Save states -----
     elseif cmd == "saveState" then
@@ -504,9 +579,23 @@ end
 -- FRAME CALLBACKS
 -- ==========================================================================
 
+-- Start the next steps of a button sequence once the current step's wait
+-- has elapsed. Returns true when every step has finished.
+local function advance_sequence(seq)
+    while seq.frames_remaining <= 0 do
+        seq.index = seq.index + 1
+        local step = seq.steps[seq.index]
+        if not step then return true end
+        table.insert(pending_presses, {key = step.key, frames_remaining = step.frames})
+        seq.frames_remaining = step.wait
+    end
+    return false
+end
+
 -- Called every frame by mGBA. Processes:
---   1. Pending button presses — injects active keys via emu:addKey()
---   2. Pending frame advances — counts down and sends deferred responses
+--   1. Pending button sequences — queues each step's press when it is due
+--   2. Pending button presses — injects active keys via emu:addKey()
+--   3. Pending frame advances — counts down and sends deferred responses
 local function on_frame()
     -- Clear all scripted keys first, then re-add only active ones.
     -- This prevents keys from being held permanently if addKey is persistent.
@@ -515,8 +604,23 @@ local function on_frame()
         pcall(function() emu:clearKey(gba_key) end)
     end
 
-    -- Inject all currently-active button holds into the emulator
+    -- Advance button sequences and respond to any that have finished
     local i = 1
+    while i <= #pending_sequences do
+        local seq = pending_sequences[i]
+        if advance_sequence(seq) then
+            local resp = {ok = true}
+            if seq.id then resp.id = seq.id end
+            pcall(send_response, seq.client, resp)
+            table.remove(pending_sequences, i)
+        else
+            seq.frames_remaining = seq.frames_remaining - 1
+            i = i + 1
+        end
+    end
+
+    -- Inject all currently-active button holds into the emulator
+    i = 1
     while i <= #pending_presses do
         local p = pending_presses[i]
         if p.frames_remaining > 0 then
@@ -21,6 +21,7 @@ Usage from CLI:
 """
 
 import base64
+import binascii
 import os
 import sys
 from datetime import datetime
@@ -29,6 +30,16 @@ from datetime import datetime
 # Default directory for all screenshots (project_root/screenshots/)
 SCREENSHOTS_DIR = os.path.join(os.path.dirname(__file__), "..", "screenshots")
 
+# Base64 text decoded per write when saving. A multiple of 4 characters, so
+# each chunk decodes on its own.
+_B64_CHUNK = 64 * 1024
+
+# Translation table that deletes every ASCII character not allowed in a
+# label (anything other than letters, digits and underscore)
+_LABEL_STRIP = str.maketrans("", "", "".join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c == "_")
+))
+
 
 class ScreenshotManager:
     """Manages screenshot saving with session-scoped naming and sequencing.
@@ -81,7 +92,11 @@ class ScreenshotManager:
         # Sanitize the label: lowercase, replace spaces with underscores,
         # remove any characters that aren't alphanumeric or underscore
         safe_label = label.lower().replace(" ", "_")
-        safe_label = "".join(c for c in safe_label if c.isalnum() or c == "_")
+        if safe_label.isascii():
+            safe_label = safe_label.translate(_LABEL_STRIP)
+        else:
+            # Non-ASCII letters are kept too, so check each character
+            safe_label = "".join(c for c in safe_label if c.isalnum() or c == "_")
 
         # Build filename: session_sequence_label.png
         filename = f"{self.session_id}_{self._counter:03d}_{safe_label}.png"
@@ -91,9 +106,19 @@ class ScreenshotManager:
         if "," in b64_data:
             b64_data = b64_data.split(",", 1)[1]
 
-        # Decode and write the PNG binary data
+        # Decode and write the PNG binary data chunk by chunk, so the whole
+        # decoded image is never held in memory alongside the base64 text.
+        # Chunk boundaries only line up when the text is pure base64, so any
+        # other character (e.g. line breaks) falls back to one decode call,
+        # which skips them as before.
         with open(filepath, "wb") as f:
-            f.write(base64.b64decode(b64_data))
+            try:
+                for start in range(0, len(b64_data), _B64_CHUNK):
+                    f.write(base64.b64decode(b64_data[start:start + _B64_CHUNK], validate=True))
+            except binascii.Error:
+                f.seek(0)
+                f.truncate()
+                f.write(base64.b64decode(b64_data))
 
         return os.path.abspath(filepath)
 